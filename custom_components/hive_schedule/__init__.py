@@ -4,17 +4,23 @@ Uses RefreshToken for 30-day authentication without MFA
 """
 from __future__ import annotations
 
+import asyncio
+import importlib
 import logging
 import json
 import os
+import re
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Any
 
+import aiohttp
 import voluptuous as vol
 import yaml
-import aiofiles
-
-from apyhiveapi import Auth
+from yarl import URL
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, ServiceCall
@@ -22,10 +28,13 @@ from homeassistant.helpers import config_validation as cv
 from homeassistant.const import CONF_USERNAME, CONF_PASSWORD
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import aiohttp_client
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.json import json_dumps
 from homeassistant.helpers.storage import Store
 
 from .const import (
     DOMAIN,
+    HIVE_API_URL,
     SERVICE_SET_DAY,
     ATTR_NODE_ID,
     ATTR_DAY,
@@ -34,124 +43,301 @@ from .const import (
 )
 
 _LOGGER = logging.getLogger(__name__)
+
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it -
+# they are an order of magnitude faster than the pure-Python versions.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 VERSION = "2.1.0"
 PROFILES_FILE = "hive_schedule_profiles.yaml"
 TOKEN_STORAGE_VERSION = 1
 TOKEN_STORAGE_KEY = "hive_schedule_tokens"
 
+# One shared timer keeps tokens fresh for every config entry. The margin
+# exceeds the interval so a token is always renewed one tick before it
+# could expire and service calls never pay the Cognito round-trip.
+TOKEN_REFRESH_INTERVAL = timedelta(minutes=30)
+TOKEN_REFRESH_MARGIN = TOKEN_REFRESH_INTERVAL + timedelta(minutes=5)
+_DATA_UNSUB_REFRESH = "_unsub_refresh"
+
+# Parsed-profiles cache keyed by file path; the value records the
+# (st_mtime_ns, st_size) of the file the dicts were parsed from so edits
+# invalidate the cache automatically, plus the validated profiles and their
+# pre-built Hive wire-format lists. Cached dicts are shared - treat as
+# read-only.
+_PROFILES_CACHE: dict[str, tuple[int, int, dict, dict]] = {}
+
+# Precompiled HH:MM validator and temperature bounds, hoisted so
+# _validate_schedule does no setup work per entry.
+_TIME_RE = re.compile(r"^([01]\d|2[0-3]):([0-5]\d)$")
+_TEMP_MIN = 5.0
+_TEMP_MAX = 32.0
+
+# C-level extractor for both schedule-entry fields; a single call replaces
+# the isinstance/membership/subscript chain per entry in _compile_schedule.
+_GET_TIME_TEMP = itemgetter("time", "temp")
+
+# Sort key for compiled wire-format entries
+_GET_START = itemgetter("start")
+
+# Overall timeout for Hive API requests
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+# Static request headers; only Authorization varies per call
+_BASE_HEADERS = {"Content-Type": "application/json"}
+
+# Nodes endpoint base, built once from the API root in const.py
+_NODES_URL = f"{HIVE_API_URL}/nodes/"
+
+
+@lru_cache(maxsize=64)
+def _node_url(node_id: str) -> URL:
+    """Pre-parsed nodes endpoint URL, cached per node."""
+    return URL(_NODES_URL + node_id)
+
+# Canonical weekday order, also used by the service schema
+_WEEKDAYS = (
+    "monday", "tuesday", "wednesday", "thursday",
+    "friday", "saturday", "sunday",
+)
+
+@lru_cache(maxsize=1440)
+def _hhmm_to_minutes(time_str: str) -> int:
+    """Convert "HH:MM" to minutes from midnight (no validation).
+
+    Cached because callers send the same handful of times over and over;
+    1440 entries bounds the cache at every possible HH:MM value.
+    """
+    hours, _, minutes = time_str.partition(":")
+    return int(hours) * 60 + int(minutes)
+
+
+# Schedule-entry validator, a single module-level Schema instance so
+# voluptuous compiles it once rather than per service call. Entry shape,
+# time format and temperature range are all enforced here so invalid
+# service data fails fast, and "time" is coerced straight to minutes from
+# midnight so the handler does no string parsing.
+_ENTRY_SCHEMA = vol.Schema({
+    vol.Required("time"): vol.All(cv.string, vol.Match(_TIME_RE), _hhmm_to_minutes),
+    vol.Required("temp"): vol.All(
+        vol.Coerce(float), vol.Range(min=_TEMP_MIN, max=_TEMP_MAX)
+    ),
+})
+
 # Service schema
 SET_DAY_SCHEMA = vol.Schema({
     vol.Required(ATTR_NODE_ID): cv.string,
-    vol.Required(ATTR_DAY): vol.In([
-        "monday", "tuesday", "wednesday", "thursday", 
-        "friday", "saturday", "sunday"
-    ]),
+    # Accepts a single day or a list of days; case is normalized during
+    # schema validation so the handler always sees canonical lowercase
+    # day names.
+    vol.Required(ATTR_DAY): vol.All(
+        cv.ensure_list,
+        vol.Length(min=1),
+        [vol.All(vol.Lower, vol.In(_WEEKDAYS))],
+    ),
     vol.Optional(ATTR_PROFILE): cv.string,
-    vol.Optional(ATTR_SCHEDULE): vol.All(cv.ensure_list, [{
-        vol.Required("time"): cv.string,
-        vol.Required("temp"): vol.Coerce(float),
-    }])
+    vol.Optional(ATTR_SCHEDULE): vol.All(cv.ensure_list, [_ENTRY_SCHEMA]),
 })
 
 
-async def _load_profiles(hass: HomeAssistant) -> dict:
-    """Load schedule profiles from YAML file."""
-    config_path = hass.config.path(PROFILES_FILE)
-    
-    if not os.path.exists(config_path):
-        await _create_default_profiles_file(config_path)
-    
+def _read_file(path: str) -> str:
+    """Read a file in one call - run in the executor."""
+    with open(path, 'r') as file:
+        return file.read()
+
+
+def _write_file(path: str, content: str) -> None:
+    """Write a file in one call - run in the executor."""
+    with open(path, 'w') as file:
+        file.write(content)
+
+
+def _write_file_atomic(path: str, content: str) -> None:
+    """Write a file atomically via a temp file swap - run in the executor."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w') as file:
+        file.write(content)
+    os.replace(tmp_path, path)
+
+
+async def _load_profiles(hass: HomeAssistant, config_path: str) -> tuple[dict, dict]:
+    """Load schedule profiles from the YAML file at ``config_path``.
+
+    Returns ``(profiles, profiles_hive)`` where ``profiles_hive`` holds the
+    pre-built Hive wire-format list for each profile, so the service handler
+    does no per-call conversion. Results are cached against the file's mtime
+    and size, so repeated calls only cost a stat until the file is edited.
+    """
     try:
-        async with aiofiles.open(config_path, 'r') as file:
-            content = await file.read()
-            profiles = yaml.safe_load(content) or {}
-            return profiles
+        # The executor-side stat doubles as the existence check, so no
+        # blocking filesystem call ever runs on the event loop.
+        try:
+            stat = await hass.async_add_executor_job(os.stat, config_path)
+        except FileNotFoundError:
+            # First run - write the defaults and serve the built-ins
+            # directly; the file is dumped from them, so parsing what was
+            # just written would be wasted work.
+            await _create_default_profiles_file(hass, config_path)
+            return _BUILTIN_PROFILES, _BUILTIN_PROFILES_HIVE
+
+        cached = _PROFILES_CACHE.get(config_path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2], cached[3]
+
+        # Prefer the JSON sidecar cache when it is at least as fresh as the
+        # YAML - JSON parses an order of magnitude faster on a cold start.
+        sidecar_path = config_path + ".json"
+        parsed = None
+        try:
+            sidecar_stat = await hass.async_add_executor_job(os.stat, sidecar_path)
+            if sidecar_stat.st_mtime_ns >= stat.st_mtime_ns:
+                content = await hass.async_add_executor_job(_read_file, sidecar_path)
+                parsed = json.loads(content)
+        except (OSError, ValueError):
+            parsed = None
+
+        if parsed is None:
+            content = await hass.async_add_executor_job(_read_file, config_path)
+            parsed = yaml.load(content, Loader=_YAML_LOADER) or {}
+            # Refresh the sidecar (best effort) so the next cold load can
+            # skip the YAML parser entirely.
+            try:
+                await hass.async_add_executor_job(
+                    _write_file_atomic, sidecar_path, json.dumps(parsed)
+                )
+            except OSError as err:
+                _LOGGER.debug(
+                    "Could not write profiles cache %s: %s", sidecar_path, err
+                )
+
+        # Validate and convert once at load time so the service handler can
+        # trust any profile it finds; invalid profiles are dropped.
+        profiles = {}
+        profiles_hive = {}
+        for name, entries in parsed.items():
+            try:
+                profiles_hive[name] = _compile_schedule(entries)
+            except ValueError as err:
+                _LOGGER.warning("Ignoring invalid profile '%s': %s", name, err)
+            else:
+                profiles[name] = entries
+
+        _PROFILES_CACHE[config_path] = (
+            stat.st_mtime_ns, stat.st_size, profiles, profiles_hive
+        )
+        return profiles, profiles_hive
     except Exception as e:
         _LOGGER.error("Failed to load profiles: %s", e)
-        return _get_builtin_profiles()
-
-
-def _get_builtin_profiles() -> dict:
-    """Get built-in default profiles."""
-    return {
-        "workday": [
-            {"time": "05:20", "temp": 18.5},
-            {"time": "07:00", "temp": 18.0},
-            {"time": "16:30", "temp": 19.5},
-            {"time": "21:45", "temp": 16.0},
-        ],
-        "weekend": [
-            {"time": "07:30", "temp": 18.5},
-            {"time": "09:00", "temp": 18.0},
-            {"time": "16:30", "temp": 19.5},
-            {"time": "22:00", "temp": 16.0},
-        ],
-    }
+        return _BUILTIN_PROFILES, _BUILTIN_PROFILES_HIVE
 
 
-async def _create_default_profiles_file(config_path: str):
-    """Create default profiles file."""
-    default_content = """# Hive Schedule Profiles
-workday:
-  - time: "05:20"
-    temp: 18.5
-  - time: "07:00"
-    temp: 18.0
-  - time: "16:30"
-    temp: 19.5
-  - time: "21:45"
-    temp: 16.0
-
-weekend:
-  - time: "07:30"
-    temp: 18.5
-  - time: "09:00"
-    temp: 18.0
-  - time: "16:30"
-    temp: 19.5
-  - time: "22:00"
-    temp: 16.0
-"""
+async def _create_default_profiles_file(hass: HomeAssistant, config_path: str):
+    """Create default profiles file from the built-in profiles."""
     try:
-        async with aiofiles.open(config_path, 'w') as file:
-            await file.write(default_content)
+        await hass.async_add_executor_job(
+            _write_file, config_path, _DEFAULT_PROFILES_YAML
+        )
     except Exception as e:
         _LOGGER.error("Failed to create default profiles: %s", e)
 
 
-def _validate_schedule(schedule: list) -> bool:
-    """Validate schedule format."""
+def _compile_validated_schedule(schedule: list) -> list:
+    """Convert entries already validated by _ENTRY_SCHEMA to Hive wire format.
+
+    The schema has coerced "time" to minutes and "temp" to float, so this
+    is a pure reshape. The structural and range checks in _compile_schedule
+    remain necessary only for YAML profiles, where the service schema never
+    runs. Entries are sorted chronologically so Hive always receives a
+    canonical schedule regardless of declaration order.
+    """
+    hive_schedule = [
+        {"value": {"target": entry["temp"]}, "start": entry["time"]}
+        for entry in schedule
+    ]
+    hive_schedule.sort(key=_GET_START)
+    return hive_schedule
+
+
+def _compile_schedule(schedule: list) -> list:
+    """Validate schedule entries and convert them to Hive wire format.
+
+    Validation and the HH:MM -> minutes conversion share a single regex
+    match per entry, so the string is only parsed once.
+    """
     if not isinstance(schedule, list) or len(schedule) == 0:
         raise ValueError("Schedule must be a non-empty list")
-    
+
+    hive_schedule = []
     for entry in schedule:
-        if not isinstance(entry, dict) or "time" not in entry or "temp" not in entry:
-            raise ValueError("Each entry must have 'time' and 'temp'")
-        
-        # Validate time
         try:
-            hours, minutes = entry["time"].split(":")
-            if not (0 <= int(hours) <= 23 and 0 <= int(minutes) <= 59):
-                raise ValueError
-        except:
-            raise ValueError(f"Invalid time: {entry['time']}")
-        
-        # Validate temp
-        temp = float(entry["temp"])
-        if not (5.0 <= temp <= 32.0):
+            time_str, temp = _GET_TIME_TEMP(entry)
+        except (TypeError, KeyError):
+            raise ValueError("Each entry must have 'time' and 'temp'") from None
+
+        # The regex enforces both format and range
+        match = _TIME_RE.match(str(time_str))
+        if not match:
+            raise ValueError(f"Invalid time: {time_str}")
+
+        try:
+            temp = float(temp)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid temperature: {temp!r}") from None
+        if not (_TEMP_MIN <= temp <= _TEMP_MAX):
             raise ValueError(f"Temperature {temp}°C out of range")
-    
-    return True
+
+        hive_schedule.append({
+            "value": {"target": temp},
+            "start": int(match.group(1)) * 60 + int(match.group(2)),
+        })
+
+    # Sorted once here so neither the service handler nor Hive ever sees
+    # entries out of chronological order; profile files are compiled only
+    # when they change, so the sort is effectively free.
+    hive_schedule.sort(key=_GET_START)
+    return hive_schedule
+
+
+# Built-in default profiles, frozen at import so fallbacks never rebuild
+# the structure; the Hive wire-format versions are precomputed alongside.
+_BUILTIN_PROFILES = MappingProxyType({
+    "workday": [
+        {"time": "05:20", "temp": 18.5},
+        {"time": "07:00", "temp": 18.0},
+        {"time": "16:30", "temp": 19.5},
+        {"time": "21:45", "temp": 16.0},
+    ],
+    "weekend": [
+        {"time": "07:30", "temp": 18.5},
+        {"time": "09:00", "temp": 18.0},
+        {"time": "16:30", "temp": 19.5},
+        {"time": "22:00", "temp": 16.0},
+    ],
+})
+_BUILTIN_PROFILES_HIVE = MappingProxyType({
+    name: _compile_schedule(entries) for name, entries in _BUILTIN_PROFILES.items()
+})
+
+# Default profiles file content, generated from the built-ins once at
+# import so the file and the in-memory fallback can never drift.
+_DEFAULT_PROFILES_YAML = "# Hive Schedule Profiles\n" + yaml.dump(
+    dict(_BUILTIN_PROFILES), Dumper=_YAML_DUMPER, sort_keys=False
+)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Hive Schedule Manager from config entry."""
-    
-    _LOGGER.info("=" * 80)
-    _LOGGER.info("Hive Schedule Manager v%s", VERSION)
-    _LOGGER.info("Using RefreshToken for 30-day authentication")
-    _LOGGER.info("=" * 80)
-    
+    # Imported lazily: apyhiveapi drags in pycognito/botocore, which is
+    # only needed once a config entry actually loads. The import runs in
+    # HA's import executor so the module chain never blocks the event loop.
+    apyhiveapi = await hass.async_add_import_executor_job(
+        importlib.import_module, "apyhiveapi"
+    )
+    Auth = apyhiveapi.Auth
+
+    _LOGGER.info("Hive Schedule Manager v%s (RefreshToken auth)", VERSION)
+
     # Get credentials and tokens
     username = entry.data[CONF_USERNAME]
     password = entry.data[CONF_PASSWORD]
@@ -174,14 +360,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "refresh_token": stored_data.get("refresh_token") or entry.data.get("refresh_token"),
         "token_expiry": initial_expiry,
     }
+    # Parse the ISO expiry once; the per-call freshness check is then a
+    # plain float comparison against time.time().
+    token_data["token_expiry_ts"] = (
+        datetime.fromisoformat(initial_expiry).timestamp() if initial_expiry else None
+    )
     
-    _LOGGER.info("Loaded tokens: access=%s, id=%s, refresh=%s",
-                 "present" if token_data["access_token"] else "missing",
-                 "present" if token_data["id_token"] else "missing",
-                 "present" if token_data["refresh_token"] else "missing")
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info("Loaded tokens: access=%s, id=%s, refresh=%s",
+                     "present" if token_data["access_token"] else "missing",
+                     "present" if token_data["id_token"] else "missing",
+                     "present" if token_data["refresh_token"] else "missing")
     
-    # Load profiles
-    profiles = await _load_profiles(hass)
+    # Load profiles; resolve the path once and reuse it for every reload
+    profiles_path = hass.config.path(PROFILES_FILE)
+    profiles, _ = await _load_profiles(hass, profiles_path)
     _LOGGER.info("Loaded %d schedule profiles", len(profiles))
     
     # Get aiohttp session
@@ -192,9 +385,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data[DOMAIN][entry.entry_id] = {
         "username": username,
         "password": password,
+        # One Auth client per entry, reused across token refreshes
+        "auth": Auth(username, password),
         "token_data": token_data,
+        "refresh_lock": asyncio.Lock(),
         "store": store,
         "profiles": profiles,
+        "profiles_path": profiles_path,
         "websession": websession,
     }
     
@@ -202,63 +399,63 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     async def handle_set_day(call: ServiceCall) -> None:
         """Handle set_day_schedule service call."""
         node_id = call.data[ATTR_NODE_ID]
-        day = call.data[ATTR_DAY]
+        days = call.data[ATTR_DAY]
         profile_name = call.data.get(ATTR_PROFILE)
         custom_schedule = call.data.get(ATTR_SCHEDULE)
-        
-        # Get schedule
+
+        # Reload profiles so edits to the YAML file take effect without a
+        # restart; the mtime/size cache makes this a stat on the fast path.
+        profiles, profiles_hive = await _load_profiles(hass, profiles_path)
+        hass.data[DOMAIN][entry.entry_id]["profiles"] = profiles
+
+        # Get schedule in Hive wire format; profiles were validated and
+        # converted at load time, so only a user-supplied custom schedule
+        # needs checking and converting here.
         if profile_name:
-            if profile_name not in profiles:
+            if profile_name not in profiles_hive:
                 raise HomeAssistantError(f"Unknown profile: {profile_name}")
-            day_schedule = profiles[profile_name]
+            hive_schedule = profiles_hive[profile_name]
         elif custom_schedule:
-            day_schedule = custom_schedule
+            hive_schedule = _compile_validated_schedule(custom_schedule)
         else:
             raise HomeAssistantError("Either 'profile' or 'schedule' required")
-        
-        # Validate
-        _validate_schedule(day_schedule)
-        
-        _LOGGER.info("Setting %s schedule on node %s", day, node_id)
-        
-        # Convert to Hive format
-        hive_schedule = []
-        for entry in day_schedule:
-            hours, minutes = entry["time"].split(":")
-            hive_schedule.append({
-                "value": {"target": entry["temp"]},
-                "start": int(hours) * 60 + int(minutes)
-            })
-        
-        schedule_data = {"schedule": {day: hive_schedule}}
+
+        day_list = ", ".join(days)
+        _LOGGER.debug("Setting %s schedule on node %s", day_list, node_id)
+
+        # All requested days go into one POST so a Mon-Fri update costs a
+        # single round-trip. Serialize once with HA's orjson-backed dumper;
+        # the same payload is reused unchanged if the request is retried
+        # after a refresh.
+        payload = json_dumps({"schedule": {day: hive_schedule for day in days}})
         
         # Get valid token (refresh if needed)
         token = await _get_valid_token(hass, entry.entry_id)
         
         # Make API request
-        url = f"https://beekeeper-uk.hivehome.com/1.0/nodes/{node_id}"
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": token,  # Use IdToken (plain, no Bearer)
-        }
+        url = _node_url(node_id)
+        # Use IdToken (plain, no Bearer)
+        headers = {**_BASE_HEADERS, "Authorization": token}
         
-        async with websession.post(url, json=schedule_data, headers=headers) as response:
-            if response.status == 200:
-                _LOGGER.info("✓ Successfully updated %s schedule", day)
-            elif response.status in (401, 403):
-                # Token invalid - force refresh and retry
-                _LOGGER.warning("Token rejected, forcing refresh...")
-                token = await _get_valid_token(hass, entry.entry_id, force_refresh=True)
-                headers["Authorization"] = token
-                
-                async with websession.post(url, json=schedule_data, headers=headers) as response2:
-                    if response2.status == 200:
-                        _LOGGER.info("✓ Successfully updated %s schedule (after refresh)", day)
-                    else:
-                        error_text = await response2.text()
-                        raise HomeAssistantError(f"API error {response2.status}: {error_text}")
-            else:
-                error_text = await response.text()
+        # POST with a single retry after a forced token refresh on 401/403
+        for attempt in range(2):
+            async with websession.post(
+                url, data=payload, headers=headers, timeout=_REQUEST_TIMEOUT
+            ) as response:
+                if response.status == 200:
+                    _LOGGER.info("✓ Successfully updated %s schedule", day_list)
+                    return
+
+                if response.status in (401, 403) and attempt == 0:
+                    # Token invalid - force refresh and retry
+                    _LOGGER.warning("Token rejected, forcing refresh...")
+                    token = await _get_valid_token(
+                        hass, entry.entry_id, force_refresh=True
+                    )
+                    headers["Authorization"] = token
+                    continue
+
+                error_text = (await response.text())[:500]
                 raise HomeAssistantError(f"API error {response.status}: {error_text}")
     
     hass.services.async_register(
@@ -267,7 +464,38 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         handle_set_day,
         schema=SET_DAY_SCHEMA
     )
-    
+
+    # Register one shared refresh timer for the whole domain rather than
+    # one per config entry; the first entry to set up creates it.
+    if _DATA_UNSUB_REFRESH not in hass.data[DOMAIN]:
+        async def _refresh_all_tokens(_now) -> None:
+            margin = TOKEN_REFRESH_MARGIN.total_seconds()
+            for entry_id in list(hass.data[DOMAIN]):
+                if entry_id == _DATA_UNSUB_REFRESH:
+                    continue
+                # The await below yields to the loop, so an entry may be
+                # unloaded mid-iteration; skip any that have disappeared.
+                data = hass.data[DOMAIN].get(entry_id)
+                if data is None:
+                    continue
+                expiry_ts = data["token_data"].get("token_expiry_ts")
+                if expiry_ts and time.time() < expiry_ts - margin:
+                    continue
+                try:
+                    await _get_valid_token(hass, entry_id, force_refresh=True)
+                except KeyError:
+                    # Entry unloaded between the check and the refresh
+                    continue
+                except HomeAssistantError as err:
+                    _LOGGER.warning(
+                        "Periodic token refresh failed for entry %s: %s",
+                        entry_id, err,
+                    )
+
+        hass.data[DOMAIN][_DATA_UNSUB_REFRESH] = async_track_time_interval(
+            hass, _refresh_all_tokens, TOKEN_REFRESH_INTERVAL
+        )
+
     _LOGGER.info("✓ Hive Schedule Manager setup complete")
     return True
 
@@ -279,57 +507,77 @@ async def _get_valid_token(hass: HomeAssistant, entry_id: str, force_refresh: bo
     store = data["store"]
     
     # Check if token is still valid (< 55 minutes old to be safe)
-    now = datetime.now()
-    expiry = token_data.get("token_expiry")
-    
-    if expiry and not force_refresh:
-        expiry_dt = datetime.fromisoformat(expiry)
-        if now < expiry_dt:
-            _LOGGER.debug("Using cached token (expires in %s)", expiry_dt - now)
-            return token_data["id_token"]
-    
-    # Need to refresh token
-    _LOGGER.info("Token expired or force_refresh=True, refreshing using RefreshToken...")
-    
-    refresh_token = token_data.get("refresh_token")
-    if not refresh_token:
-        raise HomeAssistantError("No RefreshToken available - please reconfigure integration")
-    
-    # Use Auth to refresh (this uses RefreshToken, no MFA needed!)
-    auth = Auth(data["username"], data["password"])
-    
-    try:
-        # Set the refresh token
-        if hasattr(auth, 'refresh_token'):
-            auth.refresh_token = refresh_token
-        
-        # Call refresh (method name might vary)
-        new_tokens = await auth.renew_access_token(refresh_token)
-        
-        _LOGGER.info("✓ Successfully refreshed tokens (no MFA required!)")
-        
-        # Update stored tokens
-        auth_result = new_tokens.get('AuthenticationResult', {})
-        token_data["access_token"] = auth_result.get('AccessToken')
-        token_data["id_token"] = auth_result.get('IdToken')
-        token_data["token_expiry"] = (now + timedelta(seconds=3300)).isoformat()  # 55 min
-        
-        # Save to storage
-        await store.async_save(token_data)
-        
+    expiry_ts = token_data.get("token_expiry_ts")
+
+    if expiry_ts and not force_refresh and time.time() < expiry_ts:
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Using cached token (expires in %.0fs)", expiry_ts - time.time()
+            )
         return token_data["id_token"]
-        
-    except Exception as e:
-        _LOGGER.error("Token refresh failed: %s", e)
-        _LOGGER.error("RefreshToken may have expired (30 days) - please reconfigure integration")
-        raise HomeAssistantError("Authentication failed - please reconfigure integration") from e
+
+    # Coalesce concurrent refreshes: one caller does the network round-trip
+    # and everyone else waiting on the lock reuses the token it stored.
+    stale_id_token = token_data.get("id_token")
+    async with data["refresh_lock"]:
+        # Re-check under the lock - another caller may have refreshed while
+        # we waited. A fresh token also satisfies a forced refresh, since
+        # forcing only means the old token was rejected.
+        expiry_ts = token_data.get("token_expiry_ts")
+        if (
+            expiry_ts
+            and time.time() < expiry_ts
+            and (not force_refresh or token_data.get("id_token") != stale_id_token)
+        ):
+            return token_data["id_token"]
+
+        # Need to refresh token
+        _LOGGER.info("Token expired or force_refresh=True, refreshing using RefreshToken...")
+
+        refresh_token = token_data.get("refresh_token")
+        if not refresh_token:
+            raise HomeAssistantError("No RefreshToken available - please reconfigure integration")
+
+        # Use the per-entry Auth client to refresh (RefreshToken, no MFA needed!)
+        auth = data["auth"]
+
+        try:
+            # Set the refresh token
+            if hasattr(auth, 'refresh_token'):
+                auth.refresh_token = refresh_token
+
+            # Call refresh (method name might vary)
+            new_tokens = await auth.renew_access_token(refresh_token)
+
+            _LOGGER.info("✓ Successfully refreshed tokens (no MFA required!)")
+
+            # Update stored tokens
+            auth_result = new_tokens.get('AuthenticationResult', {})
+            now = datetime.now()
+            token_data["access_token"] = auth_result.get('AccessToken')
+            token_data["id_token"] = auth_result.get('IdToken')
+            token_data["token_expiry"] = (now + timedelta(seconds=3300)).isoformat()  # 55 min
+            token_data["token_expiry_ts"] = now.timestamp() + 3300
+
+            # Persist with a short delay so back-to-back refreshes coalesce
+            # into one write; HA flushes pending delayed saves on shutdown.
+            store.async_delay_save(lambda: token_data, 10)
+
+            return token_data["id_token"]
+
+        except Exception as e:
+            _LOGGER.error("Token refresh failed: %s", e)
+            _LOGGER.error("RefreshToken may have expired (30 days) - please reconfigure integration")
+            raise HomeAssistantError("Authentication failed - please reconfigure integration") from e
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     hass.data[DOMAIN].pop(entry.entry_id)
-    
-    if not hass.data[DOMAIN]:
+
+    if not any(key != _DATA_UNSUB_REFRESH for key in hass.data[DOMAIN]):
+        if unsub := hass.data[DOMAIN].pop(_DATA_UNSUB_REFRESH, None):
+            unsub()
         hass.services.async_remove(DOMAIN, SERVICE_SET_DAY)
-    
+
     return True
\ No newline at end of file
@@ -24,11 +24,10 @@ class HiveScheduleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     ) -> FlowResult:
         """Handle the initial step."""
         
-        # Check if official Hive integration is configured
-        hive_entries = [
-            entry for entry in self.hass.config_entries.async_entries()
-            if entry.domain == "hive"
-        ]
+        # Check if official Hive integration is configured; async_entries
+        # with a domain argument uses HA's internal index rather than
+        # scanning every config entry.
+        hive_entries = self.hass.config_entries.async_entries("hive")
         
         if not hive_entries:
             _LOGGER.error("No Hive integration found in config entries")
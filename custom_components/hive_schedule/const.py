@@ -1,18 +1,19 @@
 """Constants for the Hive Schedule Manager integration v2.0."""
+from typing import Final
 
-DOMAIN = "hive_schedule"
+DOMAIN: Final = "hive_schedule"
 
 # Configuration
-CONF_MFA_CODE = "mfa_code"
+CONF_MFA_CODE: Final = "mfa_code"
 
 # Service names
-SERVICE_SET_DAY = "set_day_schedule"
+SERVICE_SET_DAY: Final = "set_day_schedule"
 
 # Attributes
-ATTR_NODE_ID = "node_id"
-ATTR_DAY = "day"
-ATTR_SCHEDULE = "schedule"
-ATTR_PROFILE = "profile"
+ATTR_NODE_ID: Final = "node_id"
+ATTR_DAY: Final = "day"
+ATTR_SCHEDULE: Final = "schedule"
+ATTR_PROFILE: Final = "profile"
 
 # Hive API
-HIVE_API_URL = "https://beekeeper-uk.hivehome.com/1.0"
\ No newline at end of file
+HIVE_API_URL: Final = "https://beekeeper-uk.hivehome.com/1.0"
@@ -0,0 +1,79 @@
+"""Decode a Hive schedule JSON payload into readable day/time/temp lines.
+
+Handy for inspecting what the Hive API (or a get_schedule call) returned.
+Pass the JSON as an argument or pipe it on stdin:
+
+    python decode_schedule.py '{"schedule": {"monday": [...]}}'
+    python decode_schedule.py < schedule.json
+"""
+import json
+import sys
+from operator import itemgetter
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+DAYS = (
+    "monday", "tuesday", "wednesday", "thursday",
+    "friday", "saturday", "sunday",
+)
+
+# Precomputed minute -> "HH:MM" table; indexing replaces the divmod and
+# f-string formatting in the per-entry loop.
+_MIN2TIME = tuple(f"{m // 60:02d}:{m % 60:02d}" for m in range(24 * 60))
+
+# C-level getters beat repeated dict subscripting in the decode loop.
+_start = itemgetter("start")
+_value = itemgetter("value")
+_target = itemgetter("target")
+
+
+def minutes_to_time(minutes: int) -> str:
+    """Convert minutes from midnight to "HH:MM"."""
+    if 0 <= minutes < 1440:
+        return _MIN2TIME[minutes]
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def decode_schedule(schedule_json: str) -> None:
+    """Print a Hive schedule payload in a readable form.
+
+    Output is accumulated and written in one go rather than printed per
+    line, so a full week's schedule costs a single write.
+    """
+    data = _loads(schedule_json)
+    if not isinstance(data, dict):
+        raise ValueError("expected a JSON object")
+    schedule = data.get("schedule", data)
+    if not isinstance(schedule, dict):
+        raise ValueError("expected a JSON object")
+
+    out: list[str] = []
+    for day in DAYS:
+        entries = schedule.get(day)
+        if not entries:
+            continue
+        out.append(f"{day.capitalize()}:")
+        for entry in entries:
+            time_str = minutes_to_time(_start(entry))
+            temp = _target(_value(entry))
+            out.append(f"  {time_str} -> {temp}°C")
+
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def main() -> None:
+    raw = sys.argv[1] if len(sys.argv) > 1 else sys.stdin.read()
+    try:
+        decode_schedule(raw)
+    except (ValueError, KeyError, TypeError) as err:
+        print(f"Could not decode schedule: {err}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()